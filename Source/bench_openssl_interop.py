@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from rsa_multiprime import max_primes
+
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+ENCRYPT_TOOL = os.path.join(SOURCE_DIR, 'project_03_02', 'rsa_encrypt.py')
+DECRYPT_TOOL = os.path.join(SOURCE_DIR, 'project_03_02', 'rsa_decrypt.py')
+SIGNATURE_TOOL = os.path.join(SOURCE_DIR, 'project_03_03', 'rsa_signature.py')
+
+# Throughput is measured in-process on the same functions the tools call
+sys.path.insert(0, os.path.join(SOURCE_DIR, 'project_03_02'))
+sys.path.insert(0, os.path.join(SOURCE_DIR, 'project_03_03'))
+
+from rsa_decrypt import decrypt_data
+from rsa_encrypt import encrypt_data
+from rsa_signature import (
+    load_private_key, load_public_key, sign_message_raw, verify_signature_raw,
+)
+
+# openssl pkeyutl -sign without -digest refuses input longer than
+# EVP_MAX_MD_SIZE (64 bytes), so sign a hash-sized message
+SIGN_MESSAGE_SIZE = 32
+
+
+def run(cmd):
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError as e:
+        raise RuntimeError(f"{cmd[0]} not found or not executable ({e}); install OpenSSL and add it to PATH") from e
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(cmd)} failed: {result.stderr.decode(errors='replace').strip()}")
+    return result.stdout.decode(errors='replace')
+
+
+def read_file(path):
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def write_file(path, data):
+    with open(path, 'wb') as f:
+        f.write(data)
+
+
+def generate_keys(directory, bits, primes):
+    priv = os.path.join(directory, f'priv_{bits}_{primes}.pem')
+    pub = os.path.join(directory, f'pub_{bits}_{primes}.pem')
+    run(['openssl', 'genpkey', '-algorithm', 'RSA', '-out', priv,
+         '-pkeyopt', f'rsa_keygen_bits:{bits}',
+         '-pkeyopt', f'rsa_keygen_primes:{primes}'])
+    run(['openssl', 'pkey', '-in', priv, '-out', pub, '-pubout'])
+    return priv, pub
+
+
+# Python tools (same command lines as in the READMEs)
+
+def python_encrypt(pub, plain, cipher):
+    run([sys.executable, ENCRYPT_TOOL, pub, plain, cipher])
+
+
+def python_decrypt(priv, cipher, plain):
+    run([sys.executable, DECRYPT_TOOL, priv, cipher, plain])
+
+
+def python_sign(priv, message, signature):
+    run([sys.executable, SIGNATURE_TOOL, 'sign', priv, message, signature])
+
+
+def python_verify(pub, message, signature):
+    run([sys.executable, SIGNATURE_TOOL, 'verify', pub, message, signature])
+
+
+# OpenSSL CLI; pkeyutl works on a single RSA block, so split like rsa_encrypt.py
+
+def openssl_encrypt(pub, plain, cipher, block_size):
+    plaintext = read_file(plain)
+    blocks = []
+    for i in range(0, len(plaintext), block_size):
+        block_in = cipher + '.in'
+        block_out = cipher + '.out'
+        write_file(block_in, plaintext[i:i + block_size])
+        run(['openssl', 'pkeyutl', '-in', block_in, '-out', block_out,
+             '-inkey', pub, '-pubin', '-encrypt'])
+        blocks.append(read_file(block_out))
+    write_file(cipher, b''.join(blocks))
+
+
+def openssl_decrypt(priv, cipher, plain, key_bytes):
+    ciphertext = read_file(cipher)
+    blocks = []
+    for i in range(0, len(ciphertext), key_bytes):
+        block_in = plain + '.in'
+        block_out = plain + '.out'
+        write_file(block_in, ciphertext[i:i + key_bytes])
+        run(['openssl', 'pkeyutl', '-in', block_in, '-out', block_out,
+             '-inkey', priv, '-decrypt'])
+        blocks.append(read_file(block_out))
+    write_file(plain, b''.join(blocks))
+
+
+def openssl_sign(priv, message, signature):
+    run(['openssl', 'pkeyutl', '-in', message, '-out', signature,
+         '-inkey', priv, '-sign'])
+
+
+def openssl_verify(pub, message, signature):
+    run(['openssl', 'pkeyutl', '-in', message, '-inkey', pub, '-pubin',
+         '-verify', '-sigfile', signature])
+
+
+def python_rate(func, operations, iterations):
+    # RSA operations per second for an in-process call doing `operations` of them;
+    # None if the call fails
+    start = time.perf_counter()
+    try:
+        for _ in range(iterations):
+            func()
+    except Exception:
+        return None
+    return operations * iterations / (time.perf_counter() - start)
+
+
+def openssl_rates(bits, primes, seconds):
+    # (private ops/s, public ops/s) from one `openssl speed` run on a key of the
+    # same shape; (None, None) if openssl does not support that size
+    try:
+        output = run(['openssl', 'speed', '-seconds', str(seconds), '-mr',
+                      '-primes', str(primes), f'rsa{bits}'])
+    except RuntimeError:
+        return None, None
+    for line in output.splitlines():
+        # +F2:<index>:<bits>:<sign/s>:<verify/s>
+        if line.startswith('+F2:'):
+            fields = line.split(':')
+            return float(fields[3]), float(fields[4])
+    return None, None
+
+
+def bench_key(directory, bits, primes, payload, iterations, seconds):
+    priv, pub = generate_keys(directory, bits, primes)
+    key_bytes = bits // 8
+    # Max PKCS#1 v1.5 block size (11 bytes padding), same as rsa_encrypt.py
+    block_size = key_bytes - 11
+
+    def path(name):
+        return os.path.join(directory, f'{name}_{bits}_{primes}')
+
+    plain = path('plain')
+    message = path('mess')
+    write_file(plain, payload)
+    write_file(message, payload[:SIGN_MESSAGE_SIZE])
+
+    checks = []
+
+    def check(name, func):
+        # A tool that fails counts as FAIL, so the report is always printed
+        try:
+            ok = func()
+        except (RuntimeError, OSError):
+            ok = False
+        checks.append((name, ok))
+
+    # Encrypt with one side, decrypt with the other
+    def python_to_openssl_encrypt():
+        python_encrypt(pub, plain, path('cipher_py'))
+        openssl_decrypt(priv, path('cipher_py'), path('plain_ossl'), key_bytes)
+        return read_file(path('plain_ossl')) == payload
+
+    def openssl_to_python_encrypt():
+        openssl_encrypt(pub, plain, path('cipher_ossl'), block_size)
+        python_decrypt(priv, path('cipher_ossl'), path('plain_py'))
+        return read_file(path('plain_py')) == payload
+
+    check('python encrypt -> openssl decrypt', python_to_openssl_encrypt)
+    check('openssl encrypt -> python decrypt', openssl_to_python_encrypt)
+
+    # Sign with one side, verify with the other
+    def same_signature():
+        python_sign(priv, message, path('sign_py'))
+        openssl_sign(priv, message, path('sign_ossl'))
+        return read_file(path('sign_py')) == read_file(path('sign_ossl'))
+
+    def verified(verify, signature):
+        def func():
+            verify(pub, message, signature)
+            return True
+        return func
+
+    check('python sign == openssl sign', same_signature)
+    check('python sign -> openssl verify', verified(openssl_verify, path('sign_py')))
+    check('openssl sign -> python verify', verified(python_verify, path('sign_ossl')))
+
+    # Throughput per RSA operation: Python in-process with the key already loaded,
+    # against `openssl speed`, so neither side pays for process startup
+    try:
+        private_key = load_private_key(priv)
+        public_key = load_public_key(pub)
+        message_bytes = read_file(message)
+        ciphertext = encrypt_data(public_key, payload)
+        signature = sign_message_raw(private_key, message_bytes)
+    except Exception:
+        private_key = None
+    blocks = -(-len(payload) // block_size)
+
+    if private_key is None:
+        python_rates = [None] * 4
+    else:
+        python_rates = [
+            python_rate(lambda: encrypt_data(public_key, payload), blocks, iterations),
+            python_rate(lambda: decrypt_data(private_key, ciphertext), blocks, iterations),
+            python_rate(lambda: sign_message_raw(private_key, message_bytes), 1, iterations),
+            python_rate(lambda: verify_signature_raw(public_key, message_bytes, signature), 1, iterations),
+        ]
+    private_rate, public_rate = openssl_rates(bits, primes, seconds)
+
+    timings = list(zip(
+        ['encrypt', 'decrypt', 'sign', 'verify'],
+        python_rates,
+        [public_rate, private_rate, private_rate, public_rate],
+    ))
+
+    return checks, timings
+
+
+def print_results(bits, primes, checks, timings):
+    print(f"\n{'='*60}")
+    print(f"RSA {bits} bits, {primes} primes")
+    print(f"{'='*60}")
+
+    print("\n[Compatibility]")
+    for name, ok in checks:
+        print(f"\t{'PASS' if ok else 'FAIL'}: {name}")
+
+    print("\n[Throughput] (RSA operations/s: Python in-process vs openssl speed)")
+    print(f"\t{'op':<8} {'python op/s':>12} {'openssl op/s':>13} {'openssl/python':>15}")
+    for op, python_ops, openssl_ops in timings:
+        python_col = f"{python_ops:.1f}" if python_ops is not None else 'failed'
+        openssl_col = f"{openssl_ops:.1f}" if openssl_ops is not None else '-'
+        ratio = f"{openssl_ops / python_ops:.2f}x" if python_ops and openssl_ops is not None else '-'
+        print(f"\t{op:<8} {python_col:>12} {openssl_col:>13} {ratio:>15}")
+
+
+def positive_int(value):
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1: {value}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Kiem tra tuong thich va so sanh toc do giua cac tool Python va openssl CLI',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Vi du:
+  %(prog)s
+  %(prog)s --bits 2048 4096 --primes 2 3 4 --size 1000 --iterations 50 --seconds 2
+        """
+    )
+    parser.add_argument('--bits', type=int, nargs='+', default=[2048],
+                        help='Kich thuoc khoa (mac dinh: 2048)')
+    parser.add_argument('--primes', type=int, nargs='+', default=[2, 3],
+                        help='So so nguyen to cua khoa, multi-prime neu > 2 (mac dinh: 2 3)')
+    parser.add_argument('--size', type=positive_int, default=1000,
+                        help='Kich thuoc payload ma hoa, byte, >= 1 (mac dinh: 1000)')
+    parser.add_argument('--iterations', type=positive_int, default=20,
+                        help='So lan goi moi ham Python khi do toc do (mac dinh: 20)')
+    parser.add_argument('--seconds', type=positive_int, default=1,
+                        help='Thoi gian cho moi phep do cua openssl speed, giay (mac dinh: 1)')
+    args = parser.parse_args()
+
+    payload = os.urandom(args.size)
+    all_ok = True
+
+    with tempfile.TemporaryDirectory() as directory:
+        for bits in args.bits:
+            for primes in args.primes:
+                if primes > max_primes(bits):
+                    print(f"\nRSA {bits} bits, {primes} primes: skipped (OpenSSL allows at most {max_primes(bits)} primes)")
+                    continue
+                try:
+                    checks, timings = bench_key(directory, bits, primes, payload, args.iterations, args.seconds)
+                except RuntimeError as e:
+                    print(f"Error: {e}", file=sys.stderr)
+                    sys.exit(1)
+                print_results(bits, primes, checks, timings)
+                all_ok = all_ok and all(ok for _, ok in checks)
+
+    print(f"\n\tOverall: {'COMPATIBLE' if all_ok else 'INCOMPATIBLE'}\n")
+    if not all_ok:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+import os
+import random
+import sys
+
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+KEY_DIR = os.path.join(SOURCE_DIR, 'project_03_01')
+KEY_FILES = ['privatekey.pem', 'privatekey_3primes.pem']
+
+sys.path.insert(0, KEY_DIR)
+
+from rsa_bignum import (
+    available_bignum_backends, lcm, mod_inverse, powmod, set_bignum_backend,
+)
+from rsa_key_parser import load_private_key_components, validate_key_components
+from rsa_multiprime import MultiPrimePrivateKey, rsa_crt_private_op
+
+
+def malformed_key(components):
+    # Negative primes: _read_der_integer parses signed INTEGERs, so a broken
+    # key file can hand these to validate_key_components
+    broken = dict(components)
+    broken['p'] = -components['p']
+    broken['other_primes'] = [dict(info, prime=-info['prime']) for info in components['other_primes']]
+    return broken
+
+
+def parity_inputs(keys):
+    # Fixed (a, m) pairs: random ones (seeded), non-invertible ones, zero and
+    # negative values, and the products of primes each key's coefficients use
+    rng = random.Random(8017)
+    pairs = [(rng.getrandbits(2048), rng.getrandbits(1024) | 1) for _ in range(200)]
+    pairs += [(6 * k, 4 * k) for k in range(1, 20)]
+    pairs += [(-rng.getrandbits(512), rng.getrandbits(512) | 1) for _ in range(20)]
+    pairs += [(rng.getrandbits(512), -(rng.getrandbits(512) | 1)) for _ in range(20)]
+    pairs += [(3, -7), (-3, -7), (0, 7), (7, 0), (0, 0), (5, 1), (-5, 1), (0, 1)]
+    for components in keys:
+        r_product = components['p'] * components['q']
+        pairs.append((components['q'], components['p']))
+        for info in components['other_primes']:
+            pairs.append((r_product, info['prime']))
+            r_product *= info['prime']
+    return pairs
+
+
+def outcome(func, *args):
+    # A raised exception is part of the result and must match too
+    try:
+        return func(*args)
+    except Exception as e:
+        return f'{type(e).__name__}: {e}'
+
+
+def powmod_inputs(keys, pairs):
+    # RSA-shaped exponentiations on each key plus the generic (a, m) pairs
+    rng = random.Random(3447)
+    triples = []
+    for components in keys:
+        n = components['n']
+        value = rng.randrange(n) if n > 1 else 0
+        triples += [(value, components['d'], n), (value, components['e'], n)]
+    triples += [(a, rng.getrandbits(256), m) for a, m in pairs]
+    return triples
+
+
+def crt_inputs(keys):
+    # CRT private operation used by rsa_signature.py and rsa_decrypt.py
+    rng = random.Random(8017)
+    return [(rng.randrange(components['n']), MultiPrimePrivateKey.from_components(components))
+            for components in keys if components['n'] > 1]
+
+
+def run_backend(backend, keys, pairs, crt_cases):
+    set_bignum_backend(backend)
+    return {
+        'powmod': [outcome(powmod, b, e, m) for b, e, m in powmod_inputs(keys, pairs)],
+        'rsa_crt_private_op': [outcome(rsa_crt_private_op, value, key) for value, key in crt_cases],
+        'mod_inverse': [outcome(mod_inverse, a, m) for a, m in pairs],
+        'lcm': [outcome(lcm, a, m) for a, m in pairs],
+        'validate_key_components': [outcome(validate_key_components, components) for components in keys],
+    }
+
+
+def same_results(a, b):
+    # Bit-identical: equal values, all of type int (no gmpy2.mpz leaking out)
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(same_results(a[k], b[k]) for k in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same_results(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def main():
+    keys = [load_private_key_components(os.path.join(KEY_DIR, name)) for name in KEY_FILES]
+    keys += [malformed_key(components) for components in keys]
+    pairs = parity_inputs(keys)
+    backends = available_bignum_backends()
+
+    print(f"Keys: {', '.join(KEY_FILES)}")
+    print(f"Backends: {', '.join(backends)}")
+    if len(backends) < 2:
+        print(f"Note: only the '{backends[0]}' backend is installed, parity is trivially true")
+
+    crt_cases = crt_inputs(keys[:len(KEY_FILES)])
+    results = {backend: run_backend(backend, keys, pairs, crt_cases) for backend in backends}
+    reference = results[backends[0]]
+
+    all_same = True
+    for backend in backends[1:]:
+        for name in reference:
+            same = same_results(reference[name], results[backend][name])
+            all_same = all_same and same
+            print(f"\t{'PASS' if same else 'FAIL'}: {name} ({backends[0]} == {backend})")
+
+    print(f"\n\tOverall: {'BIT-IDENTICAL' if all_same else 'MISMATCH'}")
+    if not all_same:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,12 +3,17 @@
 import argparse
 import sys
 import os
-from math import gcd
 
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.hazmat.backends import default_backend
 
+# Source/ holds the modules shared by the tools
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_bignum import get_bignum_backend, lcm, mod_inverse
+from rsa_multiprime import parse_multiprime_private_key_pem
+
 
 def load_private_key(filepath):
     with open(filepath, 'rb') as f:
@@ -48,9 +53,19 @@ def extract_private_key_components(private_key):
         'dmp1': private_numbers.dmp1,
         'dmq1': private_numbers.dmq1,
         'iqmp': private_numbers.iqmp,
+        'other_primes': [],
     }
 
 
+def load_private_key_components(filepath):
+    try:
+        return extract_private_key_components(load_private_key(filepath))
+    except ValueError as e:
+        error = e
+    with open(filepath, 'rb') as f:
+        return parse_multiprime_private_key_pem(f.read(), error)
+
+
 def extract_public_key_components(public_key):
     # Lay n va e tu public key
     public_numbers = public_key.public_numbers()
@@ -60,23 +75,6 @@ def extract_public_key_components(public_key):
     }
 
 
-def lcm(a, b):
-    return abs(a * b) // gcd(a, b)
-
-
-def mod_inverse(a, m):
-    # Tim nghich dao modular bang thuat toan Euclid mo rong
-    old_r, r = m, a % m
-    old_s, s = 0, 1
-    
-    while r != 0:
-        quotient = old_r // r
-        old_r, r = r, old_r - quotient * r
-        old_s, s = s, old_s - quotient * s
-    
-    return (old_s % m + m) % m
-
-
 def validate_key_components(components):
     # Kiem tra tinh hop le cua khoa (dua tren rsa_chk.c)
     results = {}
@@ -89,18 +87,25 @@ def validate_key_components(components):
     dmp1 = components['dmp1']
     dmq1 = components['dmq1']
     iqmp = components['iqmp']
+    other_primes = components.get('other_primes', [])
     
-    # kiem tra n = p * q
+    # kiem tra n = p * q (* r_3 * ... * r_u voi khoa multi-prime)
     n_calc = p * q
+    for info in other_primes:
+        n_calc *= info['prime']
     results['n_equals_p_times_q'] = (n == n_calc)
     
-    # kiem tra d * e = 1 (mod lambda(n)), voi lambda(n) = lcm(p-1, q-1)
+    # kiem tra d * e = 1 (mod lambda(n)), voi lambda(n) = lcm(p-1, q-1, r_i-1)
     lambda_n = lcm(p - 1, q - 1)
+    for info in other_primes:
+        lambda_n = lcm(lambda_n, info['prime'] - 1)
     de_mod_lambda = (d * e) % lambda_n
     results['d_e_congruent_to_1_mod_lambda'] = (de_mod_lambda == 1)
     
-    # kiem tra voi phi(n) = (p-1)(q-1)
+    # kiem tra voi phi(n) = (p-1)(q-1)(r_i-1)
     phi_n = (p - 1) * (q - 1)
+    for info in other_primes:
+        phi_n *= info['prime'] - 1
     de_mod_phi = (d * e) % phi_n
     results['d_e_congruent_to_1_mod_phi'] = (de_mod_phi == 1)
     
@@ -117,7 +122,17 @@ def validate_key_components(components):
     results['iqmp_valid'] = (iqmp == iqmp_calc)
     
     # kiem tra iqmp * q = 1 (mod p)
-    results['iqmp_inverse_check'] = ((iqmp * q) % p == 1)
+    results['iqmp_inverse_check'] = (p > 0 and (iqmp * q) % p == 1)
+    
+    # kiem tra OtherPrimeInfos (RFC 8017, 3.2):
+    # d_i = d mod (r_i-1), t_i = (r_1 * ... * r_(i-1))^-1 mod r_i
+    r_product = p * q
+    for i, info in enumerate(other_primes, start=3):
+        r_i = info['prime']
+        results[f'exponent{i}_valid'] = (info['exponent'] == d % (r_i - 1))
+        results[f'coefficient{i}_valid'] = (info['coefficient'] == mod_inverse(r_product, r_i))
+        results[f'coefficient{i}_inverse_check'] = (r_i > 0 and (info['coefficient'] * r_product) % r_i == 1)
+        r_product *= r_i
     
     return results
 
@@ -148,12 +163,21 @@ def format_number(num, name, bits=None):
     return f"\t{name} ({bits} bits):\n\t\t{wrapped}"
 
 
+def prime_product_name(i):
+    # ten tich r_1 * ... * r_(i-1) dung trong coefficient t_i
+    return 'p*q' + ''.join(f'*r{j}' for j in range(3, i))
+
+
 def print_private_key_info(components, validation):
     n = components['n']
     key_bits = n.bit_length()
+    other_primes = components.get('other_primes', [])
     
     print(f"\n{'='*60}")
-    print(f"RSA Private Key ({key_bits} bits)")
+    if other_primes:
+        print(f"RSA Private Key ({key_bits} bits, {len(other_primes) + 2} primes)")
+    else:
+        print(f"RSA Private Key ({key_bits} bits)")
     print(f"{'='*60}")
     
     print("\n[Key Components]")
@@ -165,19 +189,33 @@ def print_private_key_info(components, validation):
     print(format_number(components['dmp1'], 'exponent1 (dP = d mod p-1)'))
     print(format_number(components['dmq1'], 'exponent2 (dQ = d mod q-1)'))
     print(format_number(components['iqmp'], 'coefficient (qInv = q^-1 mod p)'))
+    for i, info in enumerate(other_primes, start=3):
+        print(format_number(info['prime'], f'prime{i} (r{i})'))
+        print(format_number(info['exponent'], f'exponent{i} (d{i} = d mod r{i}-1)'))
+        print(format_number(info['coefficient'], f'coefficient{i} (t{i} = ({prime_product_name(i)})^-1 mod r{i})'))
     
-    print(f"\n[Key Validation]")
+    print(f"\n[Key Validation] (bignum backend: {get_bignum_backend()})")
     all_valid = True
     
+    n_desc = 'n = p * q'
+    if other_primes:
+        n_desc += ''.join(f' * r{i}' for i in range(3, len(other_primes) + 3))
+    
     # Required checks for a valid RSA key
     required_checks = [
-        ('n_equals_p_times_q', 'n = p * q'),
+        ('n_equals_p_times_q', n_desc),
         ('d_e_congruent_to_1_mod_lambda', 'd * e = 1 (mod lambda(n))'),
         ('dmp1_valid', 'dP = d mod (p-1)'),
         ('dmq1_valid', 'dQ = d mod (q-1)'),
         ('iqmp_valid', 'qInv = q^-1 mod p'),
         ('iqmp_inverse_check', 'qInv x q = 1 (mod p)'),
     ]
+    for i in range(3, len(other_primes) + 3):
+        required_checks += [
+            (f'exponent{i}_valid', f'd{i} = d mod (r{i}-1)'),
+            (f'coefficient{i}_valid', f't{i} = ({prime_product_name(i)})^-1 mod r{i}'),
+            (f'coefficient{i}_inverse_check', f't{i} x ({prime_product_name(i)}) = 1 (mod r{i})'),
+        ]
     
     for key, desc in required_checks:
         status = "PASS" if validation[key] else "FAIL"
@@ -231,8 +269,7 @@ Vi du:
         sys.exit(1)
     
     try:
-        private_key = load_private_key(args.private_key)
-        priv_components = extract_private_key_components(private_key)
+        priv_components = load_private_key_components(args.private_key)
         validation = validate_key_components(priv_components)
         print_private_key_info(priv_components, validation)
     except Exception as e:
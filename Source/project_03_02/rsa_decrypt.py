@@ -1,25 +1,81 @@
 #!/usr/bin/env python3
+import os
 import sys
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 from cryptography.hazmat.backends import default_backend
 
+# Source/ holds the modules shared by the tools
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_bignum import get_bignum_backend
+from rsa_multiprime import (
+    MultiPrimePrivateKey, parse_multiprime_private_key_pem, rsa_crt_private_op,
+)
+
 
 def load_private_key(priv_key_file):
     # Doc private key tu file PEM
     try:
         with open(priv_key_file, 'rb') as f:
+            data = f.read()
+        try:
             private_key = serialization.load_pem_private_key(
-                f.read(),
+                data,
                 password=None,  # khong co password
                 backend=default_backend()
             )
+        except ValueError as e:
+            # khoa multi-prime: cryptography khong doc duoc, tu parse
+            private_key = MultiPrimePrivateKey.from_components(parse_multiprime_private_key_pem(data, e))
         return private_key
     except Exception as e:
         print(f"Loi doc private key: {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def decrypt_block_raw(private_key, block):
+    # RSADP + giai padding PKCS#1 v1.5 (RFC 8017, 7.2.2) cho khoa multi-prime.
+    # Khac voi cryptography, ban Python nay khong chay constant-time.
+    key_size_bytes = (private_key.key_size + 7) // 8
+    cipher_int = int.from_bytes(block, 'big')
+    if len(block) != key_size_bytes or cipher_int >= private_key.n:
+        raise ValueError("Decryption error")
+
+    encoded = rsa_crt_private_op(cipher_int, private_key).to_bytes(key_size_bytes, 'big')
+
+    # EM = 0x00 || 0x02 || PS (>= 8 bytes khac 0) || 0x00 || M
+    separator_idx = encoded.find(bytes([0x00]), 2)
+    if encoded[0:2] != bytes([0x00, 0x02]) or separator_idx < 10:
+        raise ValueError("Decryption error")
+    return encoded[separator_idx + 1:]
+
+
+def decrypt_data(private_key, ciphertext):
+    # Giai ma ciphertext (chia block theo key size) bang RSA private key
+    block_size = private_key.key_size // 8
+    num_blocks = len(ciphertext) // block_size
+    plaintext_blocks = []
+    
+    for i in range(num_blocks):
+        block = ciphertext[i * block_size:(i + 1) * block_size]
+        
+        # Decrypt block voi PKCS#1 v1.5 (giong OpenSSL)
+        try:
+            if isinstance(private_key, MultiPrimePrivateKey):
+                plain_block = decrypt_block_raw(private_key, block)
+            else:
+                plain_block = private_key.decrypt(
+                    block,
+                    padding.PKCS1v15()
+                )
+        except Exception as e:
+            raise ValueError(f"block {i + 1}: {e}") from e
+        plaintext_blocks.append(plain_block)
+    
+    return b''.join(plaintext_blocks)
+
+
 def decrypt_file(private_key, cipher_file, plain_file):
     # Giai ma ciphertext bang RSA private key
     try:
@@ -36,33 +92,20 @@ def decrypt_file(private_key, cipher_file, plain_file):
         if len(ciphertext) % block_size != 0:
             print(f"Warning: Ciphertext size ({len(ciphertext)} bytes) khong chia het cho block size ({block_size} bytes)", file=sys.stderr)
         
-        # Chia ciphertext thanh cac block
-        num_blocks = len(ciphertext) // block_size
-        plaintext_blocks = []
-        
-        for i in range(num_blocks):
-            block = ciphertext[i * block_size:(i + 1) * block_size]
-            
-            # Decrypt block voi PKCS#1 v1.5 (giong OpenSSL)
-            try:
-                plain_block = private_key.decrypt(
-                    block,
-                    padding.PKCS1v15()
-                )
-                plaintext_blocks.append(plain_block)
-            except Exception as e:
-                print(f"Loi decrypt block {i + 1}: {e}", file=sys.stderr)
-                sys.exit(1)
+        try:
+            plaintext = decrypt_data(private_key, ciphertext)
+        except ValueError as e:
+            print(f"Loi decrypt {e}", file=sys.stderr)
+            sys.exit(1)
         
         # Ghi plaintext ra file
         with open(plain_file, 'wb') as f:
-            for block in plaintext_blocks:
-                f.write(block)
+            f.write(plaintext)
         
         print(f"Decrypt OK!")
         print(f"Ciphertext: {len(ciphertext)} bytes")
-        print(f"Plaintext: {sum(len(b) for b in plaintext_blocks)} bytes")
-        print(f"Blocks: {len(plaintext_blocks)}")
+        print(f"Plaintext: {len(plaintext)} bytes")
+        print(f"Blocks: {len(ciphertext) // block_size}")
         
     except Exception as e:
         print(f"Loi decrypt: {e}", file=sys.stderr)
@@ -86,6 +129,7 @@ def main():
     private_key = load_private_key(priv_key_file)
     
     print(f"Key size: {private_key.key_size} bits")
+    print(f"Bignum backend: {get_bignum_backend()}")
     
     # Decrypt
     print(f"Decrypting {cipher_file}...")
@@ -19,6 +19,25 @@ def load_public_key(pub_key_file):
         sys.exit(1)
 
 
+def encrypt_data(public_key, plaintext):
+    # Ma hoa plaintext bang RSA public key, chia block neu can
+    # Block size toi da voi PKCS#1 v1.5 (tru 11 bytes padding)
+    max_block_size = (public_key.key_size // 8) - 11
+    
+    ciphertext_blocks = []
+    for i in range(0, len(plaintext), max_block_size):
+        block = plaintext[i:i + max_block_size]
+        
+        # Encrypt block voi PKCS#1 v1.5 (giong OpenSSL)
+        cipher_block = public_key.encrypt(
+            block,
+            padding.PKCS1v15()
+        )
+        ciphertext_blocks.append(cipher_block)
+    
+    return b''.join(ciphertext_blocks)
+
+
 def encrypt_file(public_key, plain_file, cipher_file):
     # Ma hoa file plaintext bang RSA public key
     try:
@@ -26,33 +45,16 @@ def encrypt_file(public_key, plain_file, cipher_file):
         with open(plain_file, 'rb') as f:
             plaintext = f.read()
         
-        # Lay key size
-        key_size = public_key.key_size
-        # Block size toi da voi PKCS#1 v1.5 (tru 11 bytes padding)
-        max_block_size = (key_size // 8) - 11
-        
-        # Chia plaintext thanh cac block
-        ciphertext_blocks = []
-        
-        for i in range(0, len(plaintext), max_block_size):
-            block = plaintext[i:i + max_block_size]
-            
-            # Encrypt block voi PKCS#1 v1.5 (giong OpenSSL)
-            cipher_block = public_key.encrypt(
-                block,
-                padding.PKCS1v15()
-            )
-            ciphertext_blocks.append(cipher_block)
+        ciphertext = encrypt_data(public_key, plaintext)
         
         # Ghi ciphertext ra file
         with open(cipher_file, 'wb') as f:
-            for block in ciphertext_blocks:
-                f.write(block)
+            f.write(ciphertext)
         
         print(f"Encrypt OK!")
         print(f"Plaintext: {len(plaintext)} bytes")
-        print(f"Ciphertext: {sum(len(b) for b in ciphertext_blocks)} bytes")
-        print(f"Blocks: {len(ciphertext_blocks)}")
+        print(f"Ciphertext: {len(ciphertext)} bytes")
+        print(f"Blocks: {len(ciphertext) // (public_key.key_size // 8)}")
         
     except Exception as e:
         print(f"Loi encrypt: {e}", file=sys.stderr)
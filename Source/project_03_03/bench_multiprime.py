@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+# Source/ holds the modules shared by the tools
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_bignum import BIGNUM_BACKENDS, available_bignum_backends, set_bignum_backend
+from rsa_multiprime import MultiPrimePrivateKey, max_primes
+from rsa_signature import load_private_key, sign_message_raw, verify_signature_raw
+
+
+def generate_key(directory, bits, primes):
+    path = os.path.join(directory, f'priv_{bits}_{primes}.pem')
+    subprocess.run(
+        ['openssl', 'genpkey', '-algorithm', 'RSA', '-out', path,
+         '-pkeyopt', f'rsa_keygen_bits:{bits}',
+         '-pkeyopt', f'rsa_keygen_primes:{primes}'],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return path
+
+
+def public_key_of(private_key):
+    if isinstance(private_key, MultiPrimePrivateKey):
+        return rsa.RSAPublicNumbers(private_key.e, private_key.n).public_key()
+    return private_key.public_key()
+
+
+def bench_sign(private_key, message, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        signature = sign_message_raw(private_key, message)
+    elapsed = time.perf_counter() - start
+    return signature, iterations / elapsed
+
+
+def bench_key(private_key, message, iterations, backends):
+    # Sign with every backend; signatures must be bit-identical across them
+    rates = {}
+    signatures = set()
+    for backend in backends:
+        set_bignum_backend(backend)
+        signature, rates[backend] = bench_sign(private_key, message, iterations)
+        if not verify_signature_raw(public_key_of(private_key), message, signature):
+            raise ValueError(f"signature made with {backend} backend does not verify")
+        signatures.add(signature)
+    if len(signatures) != 1:
+        raise ValueError(f"signatures differ between backends: {', '.join(backends)}")
+    return rates
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark raw RSA signing: multi-prime vs 2-prime keys, per bignum backend'
+    )
+    parser.add_argument('--bits', type=int, nargs='+', default=[2048, 4096],
+                        help='Modulus sizes to benchmark (default: 2048 4096)')
+    parser.add_argument('--primes', type=int, nargs='+', default=[3, 4],
+                        help='Prime counts to compare against 2 primes (default: 3 4)')
+    parser.add_argument('--iterations', type=int, default=200,
+                        help='Signatures per key (default: 200)')
+    parser.add_argument('--backends', nargs='+', default=available_bignum_backends(),
+                        choices=BIGNUM_BACKENDS,
+                        help='Bignum backends to compare (default: all installed)')
+    args = parser.parse_args()
+
+    message = b'multi-prime RSA benchmark message'
+
+    print(f"{'bits':>6} {'primes':>6} {'backend':>8} {'sign/s':>10} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        for bits in args.bits:
+            baseline_rates = None
+            for primes in [2] + args.primes:
+                if primes > max_primes(bits):
+                    print(f"{bits:>6} {primes:>6} skipped (OpenSSL allows at most {max_primes(bits)} primes)")
+                    continue
+                try:
+                    key = load_private_key(generate_key(directory, bits, primes))
+                    rates = bench_key(key, message, args.iterations, args.backends)
+                except subprocess.CalledProcessError as e:
+                    print(f"Error generating {bits}-bit {primes}-prime key: {e}", file=sys.stderr)
+                    sys.exit(1)
+                except ValueError as e:
+                    print(f"Error: {bits}-bit {primes}-prime key: {e}", file=sys.stderr)
+                    sys.exit(1)
+                if baseline_rates is None:
+                    baseline_rates = rates
+                for backend, rate in rates.items():
+                    print(f"{bits:>6} {primes:>6} {backend:>8} {rate:>10.1f} {rate / baseline_rates[backend]:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
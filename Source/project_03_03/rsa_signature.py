@@ -7,14 +7,26 @@ from cryptography.hazmat.primitives.asymmetric import rsa, padding
 from cryptography.hazmat.backends import default_backend
 from cryptography.exceptions import InvalidSignature
 
+# Source/ holds the modules shared by the tools
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rsa_bignum import get_bignum_backend, powmod
+from rsa_multiprime import (
+    MultiPrimePrivateKey, parse_multiprime_private_key_pem, rsa_crt_private_op,
+)
+
 
 def load_private_key(filepath):
     with open(filepath, 'rb') as f:
+        data = f.read()
+    try:
         private_key = serialization.load_pem_private_key(
-            f.read(),
+            data,
             password=None,
             backend=default_backend()
         )
+    except ValueError as e:
+        return MultiPrimePrivateKey.from_components(parse_multiprime_private_key_pem(data, e))
     if not isinstance(private_key, rsa.RSAPrivateKey):
         raise ValueError("File does not contain an RSA private key")
     return private_key
@@ -48,13 +60,9 @@ def sign_message_raw(private_key, message):
     # Convert to integer
     padded_int = int.from_bytes(padded, 'big')
     
-    # Get private key numbers for RSA operation
-    private_numbers = private_key.private_numbers()
-    n = private_numbers.public_numbers.n
-    d = private_numbers.d
-    
-    # Raw RSA: signature = padded^d mod n
-    sig_int = pow(padded_int, d, n)
+    # Raw RSA: signature = padded^d mod n, computed per prime and recombined
+    # (2 primes, or more for multi-prime keys)
+    sig_int = rsa_crt_private_op(padded_int, private_key)
     
     # Convert back to bytes
     signature = sig_int.to_bytes(key_size_bytes, 'big')
@@ -76,7 +84,7 @@ def verify_signature_raw(public_key, message, signature):
         sig_int = int.from_bytes(signature, 'big')
         
         # Verification: decrypted = signature^e mod n
-        decrypted_int = pow(sig_int, e, n)
+        decrypted_int = powmod(sig_int, e, n)
         
         # Convert back to bytes
         decrypted = decrypted_int.to_bytes(key_size_bytes, 'big')
@@ -119,6 +127,7 @@ def do_sign(args):
         private_key = load_private_key(args.key)
         key_size = private_key.key_size
         print(f"Loaded private key from: {args.key} ({key_size} bits)")
+        print(f"Bignum backend: {get_bignum_backend()}")
     except Exception as e:
         print(f"Error loading private key: {e}", file=sys.stderr)
         sys.exit(1)
@@ -173,6 +182,7 @@ def do_verify(args):
         public_key = load_public_key(args.key)
         key_size = public_key.key_size
         print(f"Loaded public key from: {args.key} ({key_size} bits)")
+        print(f"Bignum backend: {get_bignum_backend()}")
     except Exception as e:
         print(f"Error loading public key: {e}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,87 @@
+import os
+import sys
+from math import gcd
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+
+# Bignum backend shared by the RSA tools: 'gmpy2' (GMP) when installed,
+# otherwise Python's built-in integers. BIGNUM_BACKEND=python forces the fallback.
+BIGNUM_BACKENDS = ('gmpy2', 'python')
+_bignum_backend = None
+
+
+def set_bignum_backend(name):
+    global _bignum_backend
+    if name not in BIGNUM_BACKENDS:
+        raise ValueError(f"Unknown bignum backend: {name}")
+    if name == 'gmpy2' and gmpy2 is None:
+        raise ValueError("gmpy2 is not installed")
+    _bignum_backend = name
+
+
+def get_bignum_backend():
+    return _bignum_backend
+
+
+def available_bignum_backends():
+    return [name for name in BIGNUM_BACKENDS if name != 'gmpy2' or gmpy2 is not None]
+
+
+def powmod(base, exponent, modulus):
+    if _bignum_backend == 'gmpy2':
+        return int(gmpy2.powmod(base, exponent, modulus))
+    return pow(base, exponent, modulus)
+
+
+def lcm(a, b):
+    # lcm(0, x) = 0 and the result is never negative, on both backends
+    if a == 0 or b == 0:
+        return 0
+    if _bignum_backend == 'gmpy2':
+        return int(gmpy2.lcm(a, b))
+    return abs(a * b) // gcd(a, b)
+
+
+def mod_inverse(a, m):
+    # Inverse of a mod m in [0, m); None when it does not exist (m <= 0 or
+    # gcd(a, m) != 1), so both backends give the same answer
+    if m <= 0:
+        return None
+
+    if _bignum_backend == 'gmpy2':
+        try:
+            return int(gmpy2.invert(a, m))
+        except ZeroDivisionError:
+            return None
+
+    # Extended Euclidean algorithm
+    old_r, r = m, a % m
+    old_s, s = 0, 1
+
+    while r != 0:
+        quotient = old_r // r
+        old_r, r = r, old_r - quotient * r
+        old_s, s = s, old_s - quotient * s
+
+    if old_r != 1:
+        return None
+    return old_s % m
+
+
+def _select_default_bignum_backend():
+    default = available_bignum_backends()[0]
+    requested = os.environ.get('BIGNUM_BACKEND')
+    if requested:
+        try:
+            set_bignum_backend(requested)
+            return
+        except ValueError as e:
+            print(f"Warning: ignoring BIGNUM_BACKEND={requested} ({e}), using {default}", file=sys.stderr)
+    set_bignum_backend(default)
+
+
+_select_default_bignum_backend()
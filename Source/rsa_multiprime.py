@@ -0,0 +1,196 @@
+import base64
+
+from rsa_bignum import powmod
+
+
+# OID rsaEncryption (1.2.840.113549.1.1.1) in DER form
+RSA_ENCRYPTION_OID = bytes.fromhex('2a864886f70d010101')
+
+
+def _read_der_tlv(data, offset):
+    # Read one DER element (tag, length, value); return the value and the next offset
+    if offset + 2 > len(data):
+        raise ValueError("Truncated DER data")
+    tag = data[offset]
+    length = data[offset + 1]
+    offset += 2
+    if length & 0x80:
+        num_bytes = length & 0x7f
+        if num_bytes == 0 or num_bytes > 4 or offset + num_bytes > len(data):
+            raise ValueError("Invalid DER length")
+        length = int.from_bytes(data[offset:offset + num_bytes], 'big')
+        offset += num_bytes
+    end = offset + length
+    if end > len(data):
+        raise ValueError("Truncated DER data")
+    return tag, data[offset:end], end
+
+
+def _read_der_integer(data, offset):
+    tag, value, offset = _read_der_tlv(data, offset)
+    if tag != 0x02:
+        raise ValueError("Expected DER INTEGER")
+    return int.from_bytes(value, 'big', signed=True), offset
+
+
+def parse_rsa_private_key_der(der):
+    # RSAPrivateKey (RFC 8017, A.1.2): version 0, or version 1 (multi-prime) with
+    # OtherPrimeInfos ::= SEQUENCE OF { prime, exponent, coefficient }
+    tag, body, _ = _read_der_tlv(der, 0)
+    if tag != 0x30:
+        raise ValueError("Expected DER SEQUENCE")
+
+    version, offset = _read_der_integer(body, 0)
+
+    # PKCS#8 PrivateKeyInfo: { version, AlgorithmIdentifier, OCTET STRING }
+    if offset < len(body) and body[offset] == 0x30:
+        _, algorithm, offset = _read_der_tlv(body, offset)
+        _, oid, _ = _read_der_tlv(algorithm, 0)
+        if oid != RSA_ENCRYPTION_OID:
+            raise ValueError("File does not contain an RSA private key")
+        tag, private_key, _ = _read_der_tlv(body, offset)
+        if tag != 0x04:
+            raise ValueError("Expected DER OCTET STRING")
+        return parse_rsa_private_key_der(private_key)
+
+    if version not in (0, 1):
+        raise ValueError(f"Unsupported RSAPrivateKey version: {version}")
+
+    fields = []
+    for _ in range(8):
+        value, offset = _read_der_integer(body, offset)
+        fields.append(value)
+    n, e, d, p, q, dmp1, dmq1, iqmp = fields
+
+    other_primes = []
+    if version == 1:
+        tag, infos, offset = _read_der_tlv(body, offset)
+        if tag != 0x30:
+            raise ValueError("Expected OtherPrimeInfos SEQUENCE")
+        pos = 0
+        while pos < len(infos):
+            tag, info, pos = _read_der_tlv(infos, pos)
+            if tag != 0x30:
+                raise ValueError("Expected OtherPrimeInfo SEQUENCE")
+            prime, info_offset = _read_der_integer(info, 0)
+            exponent, info_offset = _read_der_integer(info, info_offset)
+            coefficient, info_offset = _read_der_integer(info, info_offset)
+            other_primes.append({
+                'prime': prime,
+                'exponent': exponent,
+                'coefficient': coefficient,
+            })
+        if not other_primes:
+            raise ValueError("Multi-prime key without OtherPrimeInfos")
+
+    return {
+        'n': n,
+        'e': e,
+        'd': d,
+        'p': p,
+        'q': q,
+        'dmp1': dmp1,
+        'dmq1': dmq1,
+        'iqmp': iqmp,
+        'other_primes': other_primes,
+    }
+
+
+def parse_private_key_pem(data):
+    # Decode a "RSA PRIVATE KEY" or "PRIVATE KEY" PEM block, then parse the DER
+    lines = data.decode('ascii').strip().splitlines()
+    if not lines or not lines[0].startswith('-----BEGIN ') or not lines[-1].startswith('-----END '):
+        raise ValueError("File is not in PEM format")
+    label = lines[0][len('-----BEGIN '):].rstrip('-')
+    if label not in ('RSA PRIVATE KEY', 'PRIVATE KEY'):
+        raise ValueError(f"Unsupported PEM type: {label}")
+    der = base64.b64decode(''.join(lines[1:-1]))
+    return parse_rsa_private_key_der(der)
+
+
+def parse_multiprime_private_key_pem(data, error):
+    # cryptography cannot load multi-prime keys, so parse them directly. Any
+    # other key it rejected keeps cryptography's original error.
+    try:
+        components = parse_private_key_pem(data)
+    except (ValueError, UnicodeDecodeError):
+        raise error from None
+    if not components['other_primes']:
+        raise error
+    return components
+
+
+class MultiPrimePrivateKey:
+    """CRT parameters of a multi-prime RSA private key (RFC 8017)."""
+
+    def __init__(self, n, e, d, primes, exponents, coefficients):
+        self.n = n
+        self.e = e
+        self.d = d
+        self.primes = primes
+        self.exponents = exponents
+        self.coefficients = coefficients
+        self.key_size = n.bit_length()
+
+    @classmethod
+    def from_components(cls, components):
+        other_primes = components['other_primes']
+        return cls(
+            components['n'],
+            components['e'],
+            components['d'],
+            [components['p'], components['q']] + [info['prime'] for info in other_primes],
+            [components['dmp1'], components['dmq1']] + [info['exponent'] for info in other_primes],
+            [components['iqmp']] + [info['coefficient'] for info in other_primes],
+        )
+
+
+def get_crt_params(private_key):
+    """Return (n, e, d, primes, exponents, coefficients) for CRT operations."""
+    if isinstance(private_key, MultiPrimePrivateKey):
+        return (private_key.n, private_key.e, private_key.d, private_key.primes,
+                private_key.exponents, private_key.coefficients)
+
+    private_numbers = private_key.private_numbers()
+    return (private_numbers.public_numbers.n,
+            private_numbers.public_numbers.e,
+            private_numbers.d,
+            [private_numbers.p, private_numbers.q],
+            [private_numbers.dmp1, private_numbers.dmq1],
+            [private_numbers.iqmp])
+
+
+def rsa_crt_private_op(value, private_key):
+    # RSASP1 / RSADP with the CRT representation (RFC 8017, 5.2.1 step 2.b)
+    n, e, d, primes, exponents, coefficients = get_crt_params(private_key)
+    p, q = primes[0], primes[1]
+    m1 = powmod(value, exponents[0], p)
+    m2 = powmod(value, exponents[1], q)
+    h = ((m1 - m2) * coefficients[0]) % p
+    result = m2 + q * h
+
+    # Garner's recombination for each additional prime r_i
+    r_product = p * q
+    for prime, exponent, coefficient in zip(primes[2:], exponents[2:], coefficients[1:]):
+        m_i = powmod(value, exponent, prime)
+        h = ((m_i - result) * coefficient) % prime
+        result += r_product * h
+        r_product *= prime
+
+    # A fault in one CRT branch would leak a prime factor of n (Bellcore
+    # attack), so check the result and, like OpenSSL, recompute without CRT
+    if powmod(result, e, n) != value:
+        result = powmod(value, d, n)
+
+    return result
+
+
+def max_primes(bits):
+    # Same limits as OpenSSL's rsa_multip_cap()
+    if bits < 1024:
+        return 2
+    if bits < 4096:
+        return 3
+    if bits < 8192:
+        return 4
+    return 5